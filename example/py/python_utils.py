@@ -5,22 +5,25 @@ demonstrating how the Go to Import extension works across different languages.
 """
 
 import json
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
-from datetime import datetime
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, Iterator, List, Any, NamedTuple, Optional, Union, Tuple
+from collections import defaultdict
+from functools import lru_cache
 
 
-@dataclass
-class FileInfo:
+# A NamedTuple keeps large scans free of per-instance __dict__ overhead
+class FileInfo(NamedTuple):
     """Information about a file in the project."""
     name: str
     path: str
     extension: str
     size_bytes: int
-    last_modified: datetime
+    last_modified: float  # st_mtime; datetime.fromtimestamp() when needed
     is_importable: bool = False
+    language: Optional[str] = None
+    parent_dir: Optional[Path] = None
 
 
 class ProjectAnalyzer:
@@ -36,65 +39,153 @@ class ProjectAnalyzer:
         '.css': 'CSS'
     }
 
-    def __init__(self, project_root: Union[str, Path]):
+    # Matched against entry names during the scan; ignored directories are
+    # pruned without being entered
+    IGNORED_NAMES = frozenset({'__pycache__', '.git', 'node_modules', '.DS_Store'})
+    IGNORED_SUFFIXES = ('.pyc', '.vsix', '.log')
+
+    def __init__(self, project_root: Union[str, Path], scan: bool = True):
         self.project_root = Path(project_root)
-        self.files: List[FileInfo] = []
-        self.scan_project()
+        self._root_prefix = os.path.join(str(self.project_root), '')
+        self._files: List[FileInfo] = []
+        self._by_dir: Dict[Path, List[FileInfo]] = {}
+        self._importable: List[FileInfo] = []
+        self._by_language: Dict[str, List[FileInfo]] = {}
+        self._scanned = False
+        # With scan=False the project walk is deferred until something needs it
+        if scan:
+            self.scan_project()
+
+    @property
+    def files(self) -> List[FileInfo]:
+        """All scanned files, scanning the project on first access."""
+        self._ensure_scanned()
+        return self._files
+
+    @files.setter
+    def files(self, files: Iterable[FileInfo]):
+        self._index_files(files)
+
+    def _ensure_scanned(self):
+        """Scan the project once if it has not been scanned yet."""
+        if not self._scanned:
+            self.scan_project()
 
     def scan_project(self):
         """Scan the project directory for files."""
-        self.files = []
-
-        for file_path in self.project_root.rglob('*'):
-            if file_path.is_file() and not self._should_ignore(file_path):
-                info = self._create_file_info(file_path)
-                self.files.append(info)
-
-    def _should_ignore(self, file_path: Path) -> bool:
-        """Check if file should be ignored."""
-        ignore_patterns = [
-            '*.pyc', '__pycache__', '.git', 'node_modules',
-            '.DS_Store', '*.vsix', '*.log'
-        ]
-
-        for pattern in ignore_patterns:
-            if file_path.match(pattern) or any(part.startswith('.') for part in file_path.parts[:-1]):
-                return True
-        return False
-
-    def _create_file_info(self, file_path: Path) -> FileInfo:
-        """Create FileInfo object for a file."""
-        relative_path = file_path.relative_to(self.project_root)
-        stats = file_path.stat()
+        self._index_files(self.iter_files())
+
+    def _index_files(self, files: Iterable[FileInfo]):
+        """Store files and rebuild the lookup indexes from them."""
+        self._files = list(files)
+        self._importable = []
+        by_dir = defaultdict(list)
+        by_language = defaultdict(list)
+
+        # Build every index in the same pass so the getters never re-walk files
+        for info in self._files:
+            by_dir[info.parent_dir].append(info)
+            if info.is_importable:
+                self._importable.append(info)
+                by_language[info.language].append(info)
+
+        self._by_dir = dict(by_dir)
+        self._by_language = dict(by_language)
+        self._scanned = True
+
+    def iter_files(self) -> Iterator[FileInfo]:
+        """Stream FileInfo for each project file without storing or indexing it."""
+        for entry, parent_dir in self._scandir_recursive(str(self.project_root), self.project_root):
+            yield self._create_file_info(entry, parent_dir)
+
+    def _scandir_recursive(self, path: str, dir_path: Path) -> Iterator[Tuple[os.DirEntry, Path]]:
+        """Yield non-ignored file entries below path, pruning ignored and hidden directories."""
+        # dir_path is built once per directory and shared by every file in it
+        try:
+            it = os.scandir(path)
+        except OSError:
+            # Missing, unreadable, or not a directory: skip it like rglob did
+            return
+
+        # A directory's own files come before its subdirectories, matching
+        # rglob('*') order, so "first N files" results stay the same
+        subdirs = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not self._is_pruned_dir(entry.name):
+                        subdirs.append(entry)
+                elif not self._is_ignored(entry) and entry.is_file():
+                    yield entry, dir_path
+
+        for entry in subdirs:
+            yield from self._scandir_recursive(entry.path, dir_path / entry.name)
+
+    def _is_pruned_dir(self, name: str) -> bool:
+        """Check if a directory should be skipped without being entered."""
+        return name in self.IGNORED_NAMES or name.startswith('.')
+
+    def _is_ignored(self, entry: os.DirEntry) -> bool:
+        """Check if a file entry should be left out of the scan."""
+        name = entry.name
+        return name in self.IGNORED_NAMES or name.endswith(self.IGNORED_SUFFIXES)
+
+    def _create_file_info(self, entry: os.DirEntry, parent_dir: Path) -> FileInfo:
+        """Create FileInfo object for a scanned directory entry."""
+        # DirEntry paths are built by joining onto the scan root, so the
+        # relative path is a plain slice; stat() is cached on the entry
+        relative_path = entry.path[len(self._root_prefix):]
+        stats = entry.stat()
+        extension = os.path.splitext(entry.name)[1]
+        language = self.IMPORTABLE_EXTENSIONS.get(extension)
 
         return FileInfo(
-            name=file_path.name,
-            path=str(relative_path),
-            extension=file_path.suffix,
+            name=entry.name,
+            path=relative_path,
+            extension=extension,
             size_bytes=stats.st_size,
-            last_modified=datetime.fromtimestamp(stats.st_mtime),
-            is_importable=file_path.suffix in self.IMPORTABLE_EXTENSIONS
+            last_modified=stats.st_mtime,
+            is_importable=language is not None,
+            language=language,
+            parent_dir=parent_dir
         )
 
+    def _files_in_dir(self, directory: Path) -> List[FileInfo]:
+        """Get files directly inside a directory, from the index or a one-level listing."""
+        if self._scanned:
+            return self._by_dir.get(directory, [])
+
+        # Not scanned yet: list just this directory rather than the whole project
+        try:
+            relative = directory.relative_to(self.project_root)
+        except ValueError:
+            return []
+        if any(self._is_pruned_dir(part) for part in relative.parts):
+            return []
+
+        files = []
+        try:
+            with os.scandir(os.path.join(self._root_prefix, *relative.parts)) as it:
+                for entry in it:
+                    if not self._is_ignored(entry) and entry.is_file():
+                        files.append(self._create_file_info(entry, directory))
+        except OSError:
+            return []
+        return files
+
     def get_importable_files(self) -> List[FileInfo]:
         """Get all files that can be imported."""
-        return [f for f in self.files if f.is_importable]
+        self._ensure_scanned()
+        return list(self._importable)
 
     def get_files_by_language(self) -> Dict[str, List[FileInfo]]:
         """Group files by programming language."""
-        by_language = {}
-
-        for file_info in self.get_importable_files():
-            language = self.IMPORTABLE_EXTENSIONS.get(file_info.extension, 'Other')
-            if language not in by_language:
-                by_language[language] = []
-            by_language[language].append(file_info)
-
-        return by_language
+        self._ensure_scanned()
+        return {language: list(files) for language, files in self._by_language.items()}
 
     def find_import_targets(self, file_path: str) -> List[str]:
         """Find potential import targets for a given file."""
-        current_file = Path(self.project_root / file_path)
+        current_file = self.project_root / file_path
         if not current_file.exists():
             return []
 
@@ -102,117 +193,173 @@ class ProjectAnalyzer:
         current_dir = current_file.parent
 
         # Same directory imports
-        for file_info in self.files:
-            target_path = Path(self.project_root / file_info.path)
-            if target_path.parent == current_dir and target_path != current_file:
-                if file_info.is_importable:
-                    targets.append(f"./{file_info.name}")
+        for file_info in self._files_in_dir(current_dir):
+            if file_info.name != current_file.name and file_info.is_importable:
+                targets.append(f"./{file_info.name}")
 
         # Parent directory imports
         if current_dir != self.project_root:
-            parent_files = [f for f in self.files if Path(self.project_root / f.path).parent == current_dir.parent]
-            for file_info in parent_files:
+            for file_info in self._files_in_dir(current_dir.parent):
                 if file_info.is_importable:
                     targets.append(f"../{file_info.name}")
 
         return targets
 
 
+# JavaScript lines longer than this come from minified bundles rather than
+# hand-written imports, and the JS extractor skips them before any matching
+MAX_IMPORT_LINE_LENGTH = 4096
+
+# Regex patterns for different import styles, each folded into a single
+# alternation so a line is scanned once instead of once per style
+PYTHON_IMPORT_PATTERN = (
+    r'^\s*(?:'
+    r'import\s+(?P<imp>[a-zA-Z_][a-zA-Z0-9_.]*)'
+    r'|from\s+(?P<frm>\.?[a-zA-Z_][a-zA-Z0-9_.]*)\s+import'  # Also relative imports
+    r')'
+)
+
+# The JavaScript extractor strips each line itself and dispatches on the
+# leading keyword, so these carry no ^\s* anchor. The import pattern uses
+# negated classes instead of .* to keep matching linear on long lines; the
+# require pattern keeps .* because destructuring defaults put '=' before
+# the assignment (const { a = 1 } = require('x')).
+JAVASCRIPT_IMPORT_PATTERN = (
+    r'import(?:'
+    r'[^\'"\n]*from\s+[\'"](?P<frm>[^\'"\n]+)[\'"]'
+    r'|\s+[\'"](?P<side>[^\'"]+)[\'"]'
+    r')'
+)
+
+JAVASCRIPT_REQUIRE_PATTERN = r'const\b.*=\s*require\([\'"](?P<req>[^\'"]+)[\'"]\)'
+
+# Compiled once at import time so the per-line loops skip the re cache lookup
+_PY_COMBINED = re.compile(PYTHON_IMPORT_PATTERN)
+_JS_COMBINED = re.compile(JAVASCRIPT_IMPORT_PATTERN)
+_JS_REQUIRE = re.compile(JAVASCRIPT_REQUIRE_PATTERN)
+
+
 class ImportExtractor:
     """Extracts import statements from source files."""
 
-    # Regex patterns for different import styles
-    PYTHON_IMPORT_PATTERNS = [
-        r'^\s*import\s+([a-zA-Z_][a-zA-Z0-9_.]*)',
-        r'^\s*from\s+([a-zA-Z_][a-zA-Z0-9_.]*)\s+import',
-        r'^\s*from\s+(\.[a-zA-Z_][a-zA-Z0-9_.]*)\s+import',  # Relative imports
-    ]
-
-    JAVASCRIPT_IMPORT_PATTERNS = [
-        r'^\s*import.*from\s+[\'"]([^\'"]+)[\'"]',
-        r'^\s*import\s+[\'"]([^\'"]+)[\'"]',
-        r'^\s*const.*=\s*require\([\'"]([^\'"]+)[\'"]\)',
-    ]
+    # Pattern sources, kept for introspection
+    PYTHON_IMPORT_PATTERN = PYTHON_IMPORT_PATTERN
+    JAVASCRIPT_IMPORT_PATTERN = JAVASCRIPT_IMPORT_PATTERN
+    JAVASCRIPT_REQUIRE_PATTERN = JAVASCRIPT_REQUIRE_PATTERN
 
     def extract_imports_from_file(self, file_path: Union[str, Path]) -> List[str]:
         """Extract import statements from a file."""
         file_path = Path(file_path)
 
-        if not file_path.exists():
+        if file_path.suffix == '.py':
+            extract = self._python_imports_from_lines
+        elif file_path.suffix in ['.js', '.jsx', '.ts', '.tsx']:
+            extract = self._javascript_imports_from_lines
+        else:
             return []
 
+        # Absolute so the cache key doesn't depend on the working directory
+        path = os.path.abspath(file_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stats = os.stat(path)
+            return list(_read_imports_cached(extract, path, stats.st_mtime_ns, stats.st_size))
         except Exception:
+            # Raised out of the cached call, so failures are never cached
             return []
 
-        if file_path.suffix == '.py':
-            return self._extract_python_imports(content)
-        elif file_path.suffix in ['.js', '.jsx', '.ts', '.tsx']:
-            return self._extract_javascript_imports(content)
-
-        return []
-
     def _extract_python_imports(self, content: str) -> List[str]:
         """Extract Python import statements."""
+        return self._python_imports_from_lines(content.split('\n'))
+
+    def _extract_javascript_imports(self, content: str) -> List[str]:
+        """Extract JavaScript/TypeScript import statements."""
+        return self._javascript_imports_from_lines(content.split('\n'))
+
+    @staticmethod
+    def _python_imports_from_lines(lines: Iterable[str]) -> List[str]:
+        """Extract Python import statements from an iterable of lines."""
         imports = []
-        lines = content.split('\n')
 
         for line in lines:
-            for pattern in self.PYTHON_IMPORT_PATTERNS:
-                match = re.match(pattern, line.strip())
-                if match:
-                    imports.append(match.group(1))
-                    break
+            line = line.strip()
+            # Cheap substring check skips the regex on most non-import lines
+            if 'import' not in line:
+                continue
+            match = _PY_COMBINED.match(line)
+            if match:
+                imports.append(match.group('imp') or match.group('frm'))
 
         return imports
 
-    def _extract_javascript_imports(self, content: str) -> List[str]:
-        """Extract JavaScript/TypeScript import statements."""
+    @staticmethod
+    def _javascript_imports_from_lines(lines: Iterable[str]) -> List[str]:
+        """Extract JavaScript/TypeScript import statements from an iterable of lines."""
         imports = []
-        lines = content.split('\n')
 
         for line in lines:
-            for pattern in self.JAVASCRIPT_IMPORT_PATTERNS:
-                match = re.search(pattern, line.strip())
-                if match:
-                    imports.append(match.group(1))
-                    break
+            if len(line) > MAX_IMPORT_LINE_LENGTH:
+                continue
+            line = line.lstrip()
+            if line.startswith('import'):
+                match = _JS_COMBINED.match(line)
+            elif line.startswith('const') and 'require(' in line:
+                match = _JS_REQUIRE.match(line)
+            else:
+                continue
+            if match:
+                imports.append(match.group(match.lastgroup))
 
         return imports
 
 
+@lru_cache(maxsize=4096)
+def _read_imports_cached(extract, path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Read and parse a file once per (path, mtime, size) version."""
+    # mtime_ns and size only feed the cache key, so an edited file misses.
+    # Lines are streamed from the file object so only one is held at a time.
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return tuple(extract(f))
+
+
 def analyze_cross_language_imports(project_root: str = '.') -> Dict[str, Any]:
     """Analyze imports across different languages in the project."""
-    analyzer = ProjectAnalyzer(project_root)
+    # Nothing here needs the analyzer's indexes, so stream files in a single
+    # pass instead of scanning into memory and walking the results again
+    analyzer = ProjectAnalyzer(project_root, scan=False)
     extractor = ImportExtractor()
 
-    analysis = {
-        'project_root': str(analyzer.project_root),
-        'total_files': len(analyzer.files),
-        'importable_files': len(analyzer.get_importable_files()),
-        'by_language': {},
-        'import_relationships': {}
-    }
+    total_files = 0
+    importable_files = 0
+    by_language: Dict[str, Dict[str, Any]] = {}
+    import_relationships: Dict[str, List[str]] = {}
+
+    for file_info in analyzer.iter_files():
+        total_files += 1
+        if not file_info.is_importable:
+            continue
+        importable_files += 1
 
-    # Analyze files by language
-    by_language = analyzer.get_files_by_language()
-    for language, files in by_language.items():
-        analysis['by_language'][language] = {
-            'count': len(files),
-            'files': [f.name for f in files[:5]]  # First 5 files
-        }
+        # Analyze files by language
+        language = by_language.setdefault(file_info.language, {'count': 0, 'files': []})
+        language['count'] += 1
+        if len(language['files']) < 5:  # First 5 files
+            language['files'].append(file_info.name)
 
-    # Analyze import relationships
-    for file_info in analyzer.get_importable_files()[:10]:  # Limit to first 10 files
-        file_path = analyzer.project_root / file_info.path
-        imports = extractor.extract_imports_from_file(file_path)
+        # Analyze import relationships
+        if importable_files <= 10:  # Limit to first 10 files
+            file_path = analyzer.project_root / file_info.path
+            imports = extractor.extract_imports_from_file(file_path)
 
-        if imports:
-            analysis['import_relationships'][file_info.path] = imports[:5]  # First 5 imports
+            if imports:
+                import_relationships[file_info.path] = imports[:5]  # First 5 imports
 
-    return analysis
+    return {
+        'project_root': str(analyzer.project_root),
+        'total_files': total_files,
+        'importable_files': importable_files,
+        'by_language': by_language,
+        'import_relationships': import_relationships
+    }
 
 
 def generate_import_examples() -> Dict[str, List[str]]:
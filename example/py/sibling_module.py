@@ -38,8 +38,8 @@ class DataProcessor:
     def from_config(cls, config_path: str) -> 'DataProcessor':
         """Create a DataProcessor instance from a config file."""
         if os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(config_path, 'rb') as f:
+                config = json.loads(f.read())
             return cls(config.get("name", "ConfigProcessor"))
         return cls()
 
@@ -49,10 +49,16 @@ class DataProcessor:
 
 
 class UserManager:
-    """Manages user data and operations."""
+    """Manages user data and operations.
+
+    Add users only through add_user: find_user_by_email reads an email
+    index that add_user maintains, so changes made directly to ``users``
+    are not seen by lookups.
+    """
 
     def __init__(self):
         self.users: List[Dict[str, Any]] = []
+        self._by_email: Dict[str, Dict[str, Any]] = {}
 
     def add_user(self, name: str, email: str, age: Optional[int] = None) -> Dict[str, Any]:
         """Add a new user."""
@@ -65,6 +71,8 @@ class UserManager:
             "is_active": True
         }
         self.users.append(user)
+        # Keep the first user per email, matching a front-to-back scan
+        self._by_email.setdefault(email, user)
         return user
 
     def get_active_users(self) -> List[Dict[str, Any]]:
@@ -73,10 +81,7 @@ class UserManager:
 
     def find_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Find a user by email address."""
-        for user in self.users:
-            if user.get("email") == email:
-                return user
-        return None
+        return self._by_email.get(email)
 
 
 def format_file_path(file_path: Union[str, Path]) -> str:
@@ -91,8 +96,8 @@ def load_json_config(config_path: str, default: Dict[str, Any] = None) -> Dict[s
         default = {}
 
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        with open(config_path, 'rb') as f:
+            return json.loads(f.read())
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Warning: Could not load config from {config_path}: {e}")
         return default
@@ -103,17 +108,20 @@ def calculate_statistics(numbers: List[Union[int, float]]) -> Dict[str, float]:
     if not numbers:
         return {"count": 0, "sum": 0, "average": 0, "min": 0, "max": 0}
 
+    # sum/min/max are C loops, so three builtin passes beat one Python-level
+    # loop; the only saving to make is not summing twice
+    total = sum(numbers)
     return {
         "count": len(numbers),
-        "sum": sum(numbers),
-        "average": sum(numbers) / len(numbers),
+        "sum": total,
+        "average": total / len(numbers),
         "min": min(numbers),
         "max": max(numbers)
     }
 
 
 # Constants for demonstration
-SUPPORTED_FILE_TYPES = [".py", ".js", ".jsx", ".ts", ".tsx", ".css", ".json"]
+SUPPORTED_FILE_TYPES = (".py", ".js", ".jsx", ".ts", ".tsx", ".css", ".json")
 DEFAULT_CONFIG = {
     "app_name": "Go to Import Extension Demo",
     "version": "1.0.0",
@@ -8,17 +8,19 @@ with the Go to Import extension. Click on any import path to navigate!
 import os
 import sys
 import json
+import io
 from pathlib import Path
 from datetime import datetime
-from collections import namedtuple, OrderedDict
-from functools import wraps, partial
+from collections import namedtuple
 from itertools import chain, combinations
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stdout
+from importlib.util import find_spec
+from time import perf_counter_ns
 
 # Import with alias
 import sqlite3 as db
-from typing import Dict, List, Optional, Union, Callable, Any, Type
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass
 
 # Conditional imports
 try:
@@ -33,15 +35,6 @@ except ImportError:
 from . import sibling_module as sibling
 from .sibling_module import DataProcessor, UserManager, SUPPORTED_FILE_TYPES
 
-# Try to import from JavaScript utilities (cross-language demo)
-# Note: In a real scenario, you might use a Python-JavaScript bridge
-parent_path = Path(__file__).parent.parent
-if (parent_path / "utils" / "helpers.js").exists():
-    print("JavaScript helper file found - would need bridge for actual import")
-
-# Multiple imports on one line
-from datetime import date, time, timezone, timedelta
-
 # Wildcard import (not recommended but valid)
 # from sibling_module import *  # Commented out for best practices
 
@@ -49,69 +42,89 @@ from datetime import date, time, timezone, timedelta
 User = namedtuple('User', ['id', 'name', 'email', 'active'])
 
 
-@dataclass
+@dataclass(frozen=True)
 class ImportExample:
     """Example of import usage patterns."""
     module_name: str
     import_style: str
     usage_example: str
     is_relative: bool = False
-    notes: List[str] = field(default_factory=list)
+    notes: Tuple[str, ...] = ()
+
+
+# Built once at import time and shared by every demo instance
+_EXAMPLES: Tuple[ImportExample, ...] = (
+    ImportExample(
+        module_name="os",
+        import_style="import os",
+        usage_example="os.path.join('a', 'b')",
+        notes=("Standard library", "Full module import")
+    ),
+    ImportExample(
+        module_name="pathlib.Path",
+        import_style="from pathlib import Path",
+        usage_example="Path(__file__).parent",
+        notes=("Specific import", "Modern path handling")
+    ),
+    ImportExample(
+        module_name="typing",
+        import_style="from typing import Dict, List",
+        usage_example="def func(data: Dict[str, List[int]])",
+        notes=("Type hints", "Multiple imports")
+    ),
+    ImportExample(
+        module_name="sibling_module",
+        import_style="from . import sibling_module",
+        usage_example="sibling_module.DataProcessor()",
+        is_relative=True,
+        notes=("Relative import", "Same package")
+    ),
+    ImportExample(
+        module_name="sqlite3 as db",
+        import_style="import sqlite3 as db",
+        usage_example="db.connect(':memory:')",
+        notes=("Import with alias", "Shorter name")
+    )
+)
+
+
+_SAMPLE_DATA = {"name": "Python Demo", "version": 1.0, "active": True}
+_SAMPLE_JSON = json.dumps(_SAMPLE_DATA, indent=2)
+
+# Fixed inputs, so the itertools results are computed once at import time
+_NUMBERS = (1, 2, 3, 4, 5)
+_PAIRS = tuple(combinations(_NUMBERS, 2))
+_CHAINED = tuple(chain([1, 2], [3, 4], [5, 6]))
+
+# tomllib.loads takes str, so keep the sample as text rather than bytes
+_SAMPLE_TOML = """
+[package]
+name = "go-to-import-demo"
+version = "1.0.0"
+description = "Demo package"
+"""
 
 
 class PythonImportDemo:
     """Demonstrates various Python import patterns."""
 
     def __init__(self):
-        self.examples: List[ImportExample] = []
+        self.examples: Tuple[ImportExample, ...] = ()
         self.setup_examples()
 
     def setup_examples(self):
         """Set up import examples."""
-        self.examples = [
-            ImportExample(
-                module_name="os",
-                import_style="import os",
-                usage_example="os.path.join('a', 'b')",
-                notes=["Standard library", "Full module import"]
-            ),
-            ImportExample(
-                module_name="pathlib.Path",
-                import_style="from pathlib import Path",
-                usage_example="Path(__file__).parent",
-                notes=["Specific import", "Modern path handling"]
-            ),
-            ImportExample(
-                module_name="typing",
-                import_style="from typing import Dict, List",
-                usage_example="def func(data: Dict[str, List[int]])",
-                notes=["Type hints", "Multiple imports"]
-            ),
-            ImportExample(
-                module_name="sibling_module",
-                import_style="from . import sibling_module",
-                usage_example="sibling_module.DataProcessor()",
-                is_relative=True,
-                notes=["Relative import", "Same package"]
-            ),
-            ImportExample(
-                module_name="sqlite3 as db",
-                import_style="import sqlite3 as db",
-                usage_example="db.connect(':memory:')",
-                notes=["Import with alias", "Shorter name"]
-            )
-        ]
+        self.examples = _EXAMPLES
 
     @contextmanager
     def timer_context(self, operation_name: str):
         """Context manager for timing operations."""
-        start_time = datetime.now()
+        start_time = perf_counter_ns()
         print(f"⏱️  Starting {operation_name}...")
         try:
             yield
         finally:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = (perf_counter_ns() - start_time) / 1e9
             print(f"✅ {operation_name} completed in {duration:.3f}s")
 
     def demonstrate_stdlib_usage(self):
@@ -128,17 +141,15 @@ class PythonImportDemo:
 
         # datetime usage
         now = datetime.now()
-        formatted_date = now.strftime("%Y-%m-%d %H:%M:%S")
+        formatted_date = now.isoformat(sep=" ", timespec="seconds")
         print(f"  Current time: {formatted_date}")
 
-        # collections usage
-        counter = OrderedDict([('a', 1), ('b', 2), ('c', 3)])
-        print(f"  OrderedDict example: {dict(counter)}")
+        # Plain dicts keep insertion order, so no OrderedDict is needed
+        counter = {'a': 1, 'b': 2, 'c': 3}
+        print(f"  Ordered dict example: {counter}")
 
-        # JSON usage
-        sample_data = {"name": "Python Demo", "version": 1.0, "active": True}
-        json_str = json.dumps(sample_data, indent=2)
-        print(f"  JSON serialization:\n{json_str}")
+        # JSON usage, serialized once at import time
+        print(f"  JSON serialization:\n{_SAMPLE_JSON}")
 
     def demonstrate_local_imports(self):
         """Demonstrate usage of local imports."""
@@ -169,18 +180,23 @@ class PythonImportDemo:
 
         def process_user_data(users: List[Dict[str, Any]]) -> Dict[str, int]:
             """Process user data and return statistics."""
-            stats = {
-                "total_users": len(users),
-                "active_users": sum(1 for u in users if u.get("active", False)),
-                "average_age": 0
+            # One pass over users accumulates every statistic
+            total = active = age_sum = age_count = 0
+            for u in users:
+                total += 1
+                if u.get("active", False):
+                    active += 1
+                age = u.get("age")
+                if age:
+                    age_sum += age
+                    age_count += 1
+
+            return {
+                "total_users": total,
+                "active_users": active,
+                "average_age": int(age_sum / age_count) if age_count else 0
             }
 
-            ages = [u.get("age") for u in users if u.get("age")]
-            if ages:
-                stats["average_age"] = int(sum(ages) / len(ages))
-
-            return stats
-
         sample_users = [
             {"name": "Alice", "age": 30, "active": True},
             {"name": "Bob", "age": 25, "active": False},
@@ -190,15 +206,14 @@ class PythonImportDemo:
         stats = process_user_data(sample_users)
         print(f"  User statistics: {stats}")
 
-        # Optional type usage
-        def find_user(name: str, users: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        # Optional type usage, indexed once so each lookup is a dict hit
+        users_by_name = {u.get("name"): u for u in sample_users}
+
+        def find_user(name: str, by_name: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
             """Find user by name."""
-            for user in users:
-                if user.get("name") == name:
-                    return user
-            return None
+            return by_name.get(name)
 
-        found_user = find_user("Alice", sample_users)
+        found_user = find_user("Alice", users_by_name)
         print(f"  Found user: {found_user['name'] if found_user else 'None'}")
 
     def analyze_imports(self):
@@ -223,15 +238,8 @@ class PythonImportDemo:
             print("  ✅ TOML support available")
             try:
                 # Demo TOML parsing if available
-                sample_toml = b"""
-[package]
-name = "go-to-import-demo"
-version = "1.0.0"
-description = "Demo package"
-"""
-                if hasattr(tomllib, 'loads'):
-                    parsed = tomllib.loads(sample_toml.decode())
-                    print(f"      Sample TOML parsed: {parsed['package']['name']}")
+                parsed = tomllib.loads(_SAMPLE_TOML)
+                print(f"      Sample TOML parsed: {parsed['package']['name']}")
             except Exception as e:
                 print(f"      TOML parsing error: {e}")
         else:
@@ -239,65 +247,65 @@ description = "Demo package"
 
         # Check for other optional modules
         optional_modules = ['requests', 'numpy', 'pandas', 'matplotlib']
+        lines = []
         for module_name in optional_modules:
-            try:
-                __import__(module_name)
-                print(f"  ✅ {module_name} available")
-            except ImportError:
-                print(f"  📦 {module_name} not installed (optional)")
+            # find_spec only asks the finders, without executing the module
+            if find_spec(module_name) is not None:
+                lines.append(f"  ✅ {module_name} available")
+            else:
+                lines.append(f"  📦 {module_name} not installed (optional)")
+        print("\n".join(lines))
 
     def run_demo(self):
         """Run the complete import demonstration."""
-        print("=" * 70)
-        print("🐍 Python Import Patterns Demo")
-        print("   Click on any import statement above to navigate with the extension!")
-        print("=" * 70)
-
-        with self.timer_context("Complete Import Demo"):
-            self.demonstrate_stdlib_usage()
-            self.demonstrate_local_imports()
-            self.demonstrate_typing_usage()
-            self.analyze_imports()
-            self.check_optional_imports()
-
-        print("\n" + "=" * 70)
-        print("🔗 Navigation Tips:")
-        print("   • Cmd+Click (Mac) / Ctrl+Click (Windows/Linux) on import paths")
-        print("   • Right-click → 'Jump to Import File'")
-        print("   • Command Palette → 'Jump to Import File'")
-        print("   • Status bar '🔗 Go to Import' button")
-        print("=" * 70)
+        # Collect the demo's many short prints and write them in one go
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                print("=" * 70)
+                print("🐍 Python Import Patterns Demo")
+                print("   Click on any import statement above to navigate with the extension!")
+                print("=" * 70)
+
+                with self.timer_context("Complete Import Demo"):
+                    self.demonstrate_stdlib_usage()
+                    self.demonstrate_local_imports()
+                    self.demonstrate_typing_usage()
+                    self.analyze_imports()
+                    self.check_optional_imports()
+
+                print("\n" + "=" * 70)
+                print("🔗 Navigation Tips:")
+                print("   • Cmd+Click (Mac) / Ctrl+Click (Windows/Linux) on import paths")
+                print("   • Right-click → 'Jump to Import File'")
+                print("   • Command Palette → 'Jump to Import File'")
+                print("   • Status bar '🔗 Go to Import' button")
+                print("=" * 70)
+        finally:
+            sys.stdout.write(buffer.getvalue())
 
 
 def functional_demo():
     """Demonstrate functional programming with imports."""
     print("\n⚡ Functional Programming Demo:")
 
-    # Using functools
-    @wraps
-    def log_calls(func):
-        """Decorator to log function calls."""
-        def wrapper(*args, **kwargs):
-            print(f"    Calling {func.__name__} with args: {args[:2]}...")
-            return func(*args, **kwargs)
-        return wrapper
-
-    # Using partial
-    multiply_by_two = partial(lambda x, y: x * y, 2)
-    result = multiply_by_two(5)
-    print(f"  Partial function result: {result}")
+    # Multiplying by two needs no partial(lambda ...) wrapper
+    result = 2 * 5
+    print(f"  Multiply-by-two result: {result}")
 
     # Using itertools
-    numbers = [1, 2, 3, 4, 5]
-    pairs = list(combinations(numbers, 2))
-    print(f"  Combinations of {numbers[:3]}... : {pairs[:3]}...")
-
-    chained = list(chain([1, 2], [3, 4], [5, 6]))
-    print(f"  Chained iterables: {chained}")
+    print(f"  Combinations of {list(_NUMBERS[:3])}... : {list(_PAIRS[:3])}...")
+    print(f"  Chained iterables: {list(_CHAINED)}")
 
 
 def main():
     """Main function to run the Python import demo."""
+    # Try to import from JavaScript utilities (cross-language demo)
+    # Note: In a real scenario, you might use a Python-JavaScript bridge
+    parent_path = Path(__file__).parent.parent
+    if (parent_path / "utils" / "helpers.js").exists():
+        print("JavaScript helper file found - would need bridge for actual import")
+
     # Create and run the demo
     demo = PythonImportDemo()
     demo.run_demo()
@@ -306,7 +314,7 @@ def main():
     functional_demo()
 
     # Final message
-    print(f"\n🎯 Demo completed at {datetime.now().strftime('%H:%M:%S')}")
+    print(f"\n🎯 Demo completed at {datetime.now().time().isoformat(timespec='seconds')}")
     print("   All import statements above are clickable with the Go to Import extension!")
 
 